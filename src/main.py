@@ -44,7 +44,8 @@ def main(args: list[str]):
 
         # Loop forever
         while True:
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            for event_idx, event in enumerate(events):
                 if event.type == pygame.QUIT:
                     logger.info(f'Quitting nonograms...')
                     console.info(f'Quitting nonograms...')
@@ -55,6 +56,11 @@ def main(args: list[str]):
                     handle_mouse_down(event, renderer)
 
                 elif event.type == pygame.MOUSEMOTION:
+                    # The handler reads the current mouse position, so out of consecutive
+                    # motion events, only the last one needs to be handled.
+                    next_idx = event_idx + 1
+                    if next_idx < len(events) and events[next_idx].type == pygame.MOUSEMOTION:
+                        continue
                     handle_mouse_move(event, renderer)
                 
                 elif event.type == pygame.MOUSEBUTTONUP:
@@ -95,7 +101,7 @@ def handle_mouse_down(event: pygame.event.Event, renderer: Renderer) -> None:
     elif is_mmb:
         renderer.start_drag(curr_x, curr_y)
 
-    renderer.update_symbols()
+    renderer.update_symbols(mode='dirty')
     renderer.render()
 
 def handle_mouse_up(event: pygame.event.Event, renderer: Renderer) -> None:
@@ -113,7 +119,7 @@ def handle_mouse_up(event: pygame.event.Event, renderer: Renderer) -> None:
     if not is_mmb:
         renderer.end_drag()
 
-    renderer.update_symbols()
+    renderer.update_symbols(mode='dirty')
     renderer.render()
 
 def handle_mouse_move(event: pygame.event.Event, renderer: Renderer) -> None:
@@ -128,7 +134,7 @@ def handle_mouse_move(event: pygame.event.Event, renderer: Renderer) -> None:
         if (row_idx >= 0 and row_idx < renderer.puzzle.nrows and 
             col_idx >= 0 and col_idx < renderer.puzzle.ncols):
            renderer.update_draft(row_idx, col_idx)
-           renderer.update_symbols(mode='draft')
+           renderer.update_symbols(mode='dirty')
            renderer.render()
 
     if is_mmb and renderer.is_dragging:
@@ -8,10 +8,8 @@ Module for rendering the game to the screen.
 
 import pygame
 import logging
-from typing import Optional
-from functools import lru_cache
+from typing import Iterator, Optional
 
-from src.coord import Coord
 from src.cell_idx import CellIdx
 from src.puzzle import Puzzle
 import src.colors as colors
@@ -29,31 +27,47 @@ class Renderer:
 
     MINIMUM_CELL_SIZE = 4
 
+    FONT_SIZES = (40, 36, 32, 28, 24, 20, 18, 16, 14, 12, 10, 8, 6, 4)
+    """The available font sizes, from largest to smallest."""
+
+    MAX_UPDATE_RECTS = 50
+    """
+    The maximum number of changed cells for which only the changed parts of the display
+    are updated. Beyond this, the whole display is updated instead.
+    """
+
+    HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+    """True if the surfaces support `fblits`, which is only available in pygame-ce."""
+
     def __init__(self, screen: pygame.Surface) -> None:
         self.__screen = screen
         """The main screen surface."""
         self.__screen.fill(colors.MAIN_BG)
 
-        self.__fonts: list[pygame.font.Font] = []
-        """The list of available fonts."""
-        self.__fonts.append(pygame.font.SysFont('consolas', 40))
-        self.__fonts.append(pygame.font.SysFont('consolas', 36))
-        self.__fonts.append(pygame.font.SysFont('consolas', 32))
-        self.__fonts.append(pygame.font.SysFont('consolas', 28))
-        self.__fonts.append(pygame.font.SysFont('consolas', 24))
-        self.__fonts.append(pygame.font.SysFont('consolas', 20))
-        self.__fonts.append(pygame.font.SysFont('consolas', 18))
-        self.__fonts.append(pygame.font.SysFont('consolas', 16))
-        self.__fonts.append(pygame.font.SysFont('consolas', 14))
-        self.__fonts.append(pygame.font.SysFont('consolas', 12))
-        self.__fonts.append(pygame.font.SysFont('consolas', 10))
-        self.__fonts.append(pygame.font.SysFont('consolas', 8))
-        self.__fonts.append(pygame.font.SysFont('consolas', 6))
-        self.__fonts.append(pygame.font.SysFont('consolas', 4))
+        self.__fonts: dict[int, pygame.font.Font] = {}
+        """The fonts that have been loaded so far, keyed by font size. Loaded only when needed."""
+        self.__font_by_cell_size: dict[int, pygame.font.Font] = {}
+        """The optimal font for each cell size that has been used so far."""
+
+        self.__text_cache: dict[tuple[int, int, tuple],
+                                tuple[pygame.Surface, tuple[int, int]]] = {}
+        """
+        The rendered clue numbers and their offsets from the cell center,
+        keyed by the font's id, the number and the color.
+        """
 
         self.puzzle: Puzzle = None
         """The puzzle object."""
 
+        self.__top_clues: list[tuple[int, int, int]] = []
+        """The non-empty cells of the top clues grid, as (row index, col index, number)."""
+        self.__left_clues: list[tuple[int, int, int]] = []
+        """The non-empty cells of the left clues grid, as (row index, col index, number)."""
+        self.__top_clue_centers: list[tuple[int, int]] = []
+        """The center of each of the top clues cells, relative to the top clues panel."""
+        self.__left_clue_centers: list[tuple[int, int]] = []
+        """The center of each of the left clues cells, relative to the left clues panel."""
+
         self.cell_size: int = 0
         """The current size of the cell in pixels, including the zoom amount."""
         self.__cell_size_zoom_amt: int = 0
@@ -62,12 +76,18 @@ class Renderer:
         while negative values decrease it.
         """
 
-        self.__pan_delta: Coord = Coord((0, 0))
-        """The amount by which the whole puzzle is panned."""
-        self.__pan_orig_coord: Coord = None
-        """The original screen coordinates where the drag event originated."""
-        self.__pan_orig_delta: Coord = None
-        """The original pan delta when then drag event started."""
+        self.__pan_dx: int = 0
+        """The horizontal amount by which the whole puzzle is panned."""
+        self.__pan_dy: int = 0
+        """The vertical amount by which the whole puzzle is panned."""
+        self.__pan_orig_x: int = 0
+        """The original screen x-coordinate where the drag event originated."""
+        self.__pan_orig_y: int = 0
+        """The original screen y-coordinate where the drag event originated."""
+        self.__pan_orig_dx: int = 0
+        """The original horizontal pan delta when the drag event started."""
+        self.__pan_orig_dy: int = 0
+        """The original vertical pan delta when the drag event started."""
         self.is_dragging = False
         """True if the puzzle is currently being dragged."""
 
@@ -79,6 +99,8 @@ class Renderer:
         """The symbol currently being drafted."""
         self.is_drafting = False
         """True if the puzzle is currently being drafted."""
+        self.__dirty_cells: set[tuple[int, int]] = set()
+        """The row-col indices of the cells whose symbols need to be redrawn."""
 
         self.toggle_clue_start_cell: CellIdx = None
         """The cell index where the clue toggling started."""
@@ -103,8 +125,31 @@ class Renderer:
         self.left_clues_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
         self.parent_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
 
-        self.__cell_rect_memo: dict[tuple[int, int], pygame.Rect] = {}
-        """Memoization dictionary for storing the rects of each cell. Key is the row-col index."""
+        self.__actual_board_rect = pygame.Rect(0, 0, 0, 0)
+        """The board rect relative to the screen, including the pan delta."""
+        self.__board_origin_x: int = 0
+        """The screen x-coordinate of the upper left grid corner, inside the outer borders."""
+        self.__board_origin_y: int = 0
+        """The screen y-coordinate of the upper left grid corner, inside the outer borders."""
+        self.__board_metrics = utils.BoardMetrics(0, self.cell_bdr, self.sep_bdr)
+        """The cell measurements used to convert screen coordinates to cell indices."""
+
+        self.__surfaces_cell_size: Optional[int] = None
+        """The cell size that the surfaces were last drawn with."""
+
+        self.__cell_xs: tuple[int, ...] = ()
+        """The x of each board column. Relative to the board."""
+        self.__cell_ys: tuple[int, ...] = ()
+        """The y of each board row. Relative to the board."""
+        self.__cell_rects: list[list[pygame.Rect]] = []
+        """The rects of each board cell, indexed by row then column. Relative to the board."""
+
+        self.__symbol_padding: int = 0
+        """The padding between the symbols and the cell borders, for the current cell size."""
+        self.__symbol_sprites: dict[tuple[str, tuple], pygame.Surface] = {}
+        """The pre-rendered symbols, keyed by the symbol and its color."""
+        self.__x_sprite_margin: int = 0
+        """How far the crossed out symbol sprites extend past each side of the cell."""
 
         self.board_surface: pygame.Surface = None
         """The base board surface that contains the base grid."""
@@ -116,7 +161,39 @@ class Renderer:
         """The left clues panel."""
 
         self.top_clues_surface: pygame.Surface = None
-        """The left clues panel."""
+        """The top clues panel."""
+
+        self.static_surface: pygame.Surface = None
+        """
+        The board and the clues panels composited together.
+        The symbols are drawn separately on top of it.
+        """
+        self.__is_static_surface_stale = True
+        """True if the board or the clues panels changed since the static surface was composited."""
+
+        self.frame_surface: pygame.Surface = None
+        """
+        The static surface with the symbols composited on top of it.
+        This is what gets rendered on the screen.
+        """
+        self.__is_frame_surface_stale = True
+        """True if the frame surface needs to be composited again from scratch."""
+        self.__frame_dest = pygame.Rect(0, 0, 0, 0)
+        """Where the frame surface is rendered on the screen."""
+        self.__prev_frame_dest: Optional[pygame.Rect] = None
+        """Where the frame surface was last rendered on the screen, if it was rendered before."""
+        self.__symbol_area = pygame.Rect(0, 0, 0, 0)
+        """The visible part of the symbol surface, relative to the board."""
+
+        self.__is_dirty = True
+        """True if something changed since the last render."""
+        self.__needs_full_update = True
+        """True if the whole display needs to be updated on the next render."""
+        self.__updated_cell_rects: list[pygame.Rect] = []
+        """
+        The rects of the cells whose symbols were redrawn since the last render.
+        Used to update only the changed parts of the display.
+        """
 
     @property
     def screen(self) -> pygame.Surface:
@@ -124,9 +201,9 @@ class Renderer:
         return self.__screen
 
     @property
-    def pan_delta(self) -> Coord:
-        """The pan delta."""
-        return self.__pan_delta
+    def pan_delta(self) -> tuple[int, int]:
+        """The pan delta, as (x, y)."""
+        return (self.__pan_dx, self.__pan_dy)
 
     ################################################################################################
     # INITIALIZATION METHODS
@@ -136,21 +213,33 @@ class Renderer:
         """
         Initialize the puzzle to be displayed.
         """
-        logger.info(f'Initializing {puzzle.nrows}x{puzzle.ncols} puzzle...')
+        logger.info('Initializing %dx%d puzzle...', puzzle.nrows, puzzle.ncols)
         self.puzzle = puzzle
+        self.__top_clues = Renderer.__flatten_clues_grid(puzzle.top_clues_grid)
+        self.__left_clues = Renderer.__flatten_clues_grid(puzzle.left_clues_grid)
+        self.__surfaces_cell_size = None
         self.initialize_surfaces()
 
     def initialize_surfaces(self) -> None:
         """
         Initialize the board surface.
+
+        The surfaces are only recreated if the layout changed, i.e. the cell size changed.
+        """
+        if self.__recompute_layout():
+            self.__rasterize_surfaces()
+
+    def __recompute_layout(self) -> bool:
+        """
+        Calculate the cell size and the rects of the board, the clues panels and the cells.
+
+        Returns true if the layout changed since the surfaces were last drawn.
         """
         nrows = self.puzzle.nrows
         ncols = self.puzzle.ncols
         top_nrows = self.puzzle.top_clues_nrows
         left_ncols = self.puzzle.left_clues_ncols
 
-        self.__cell_rect_memo = {}
-
         # Calculate the optimum cell size where the puzzle fills the screen.
         optimum_cell_size = utils.calc_optimum_cell_size(nrows, ncols,
             self.cell_bdr, self.outer_bdr, self.sep_bdr, top_nrows, left_ncols)
@@ -161,11 +250,16 @@ class Renderer:
         # Then, apply the magnification (zoom in/out).
         self.cell_size = optimum_cell_size + self.__cell_size_zoom_amt
 
-        # Ensure that cell_size is EVEN.
-        self.cell_size = self.cell_size if self.cell_size % 2 == 0 else self.cell_size - 1
+        # Ensure that cell_size is EVEN, and quantize it to a whole number of pixels
+        # so that all the coordinate math below stays in integer arithmetic.
+        self.cell_size = int(self.cell_size if self.cell_size % 2 == 0 else self.cell_size - 1)
+
+        # If the cell size did not change (e.g. the zoom amount is already clamped),
+        # the layout and the current surfaces are still valid.
+        if self.cell_size == self.__surfaces_cell_size:
+            return False
 
         cellsz = self.cell_size
-        console.info(f'Reinitializing board, cell size is {cellsz}.')
 
         # Get the sizes and positions of the board, and the clues panels.
         board_rect, top_clues_rect, left_clues_rect, parent_rect = utils.calc_rects(
@@ -178,23 +272,92 @@ class Renderer:
         self.left_clues_rect = left_clues_rect
         self.parent_rect = parent_rect
 
+        grid_width = board_rect.width - (self.outer_bdr * 2)
+        grid_height = board_rect.height - (self.outer_bdr * 2)
+        self.__board_metrics = utils.BoardMetrics(cellsz, self.cell_bdr, self.sep_bdr,
+                                                  grid_width, grid_height)
+
+        # Precompute the positions and the rects of all the board cells.
+        bdr, sep_bdr, outer_bdr = self.cell_bdr, self.sep_bdr, self.outer_bdr
+        cell_xs = utils.calc_cell_positions(ncols, cellsz, bdr, sep_bdr, outer_bdr)
+        cell_ys = utils.calc_cell_positions(nrows, cellsz, bdr, sep_bdr, outer_bdr)
+        self.__cell_xs = cell_xs
+        self.__cell_ys = cell_ys
+        self.__cell_rects = utils.build_cell_rects(nrows, ncols, cellsz, cellsz,
+            bdr, sep_bdr, outer_bdr)
+
+        # Precompute the centers of the clue cells, relative to their panels.
+        # The top clues share their columns with the board, and the left clues share their rows.
+        half = cellsz // 2
+        top_ys = utils.calc_cell_positions(top_nrows, cellsz, bdr, sep_bdr, outer_bdr)
+        left_xs = utils.calc_cell_positions(left_ncols, cellsz, bdr, sep_bdr, outer_bdr)
+        self.__top_clue_centers = [(cell_xs[col_idx] + half, top_ys[row_idx] + half)
+                                   for row_idx, col_idx, _ in self.__top_clues]
+        self.__left_clue_centers = [(left_xs[col_idx] + half, cell_ys[row_idx] + half)
+                                    for row_idx, col_idx, _ in self.__left_clues]
+
+        self.__update_actual_board_rect()
+        return True
+
+    def __rasterize_surfaces(self) -> None:
+        """
+        Recreate the surfaces for the current layout, and draw the borders, clues and symbols.
+        """
+        nrows = self.puzzle.nrows
+        ncols = self.puzzle.ncols
+        top_nrows = self.puzzle.top_clues_nrows
+        left_ncols = self.puzzle.left_clues_ncols
+        board_rect = self.board_rect
+        top_clues_rect = self.top_clues_rect
+        left_clues_rect = self.left_clues_rect
+        parent_rect = self.parent_rect
+
+        cellsz = self.cell_size
+        console.info('Reinitializing board, cell size is %d.', cellsz)
+        self.__surfaces_cell_size = cellsz
+        self.__text_cache = {}
+
+        # Pre-render the symbols, so that they are blitted instead of drawn on each cell.
+        self.__symbol_padding = Renderer.__get_symbol_padding(cellsz)
+        self.__x_sprite_margin = self.cell_bdr + 1
+        sprite_size = cellsz - self.__symbol_padding * 2
+        self.__symbol_sprites = {}
+        for color in (colors.MAIN_SYMBOL, colors.DRAFT_SYMBOL):
+            sprite = pygame.Surface((sprite_size, sprite_size)).convert()
+            sprite.fill(color)
+            self.__symbol_sprites[('.', color)] = sprite
+            self.__symbol_sprites[('x', color)] = Renderer.__build_x_sprite(
+                cellsz, self.__x_sprite_margin, color)
+
         # Create the board surface.
-        self.board_surface = pygame.Surface((board_rect.width, board_rect.height))
+        # All the surfaces are converted to the display's pixel format so that blitting is fast.
+        self.board_surface = pygame.Surface((board_rect.width, board_rect.height)).convert()
         self.board_surface.fill(colors.PUZZLE_BG)
 
         # Create the symbols surface.
-        self.symbol_surface = pygame.Surface((board_rect.width, board_rect.height))
-        pygame.Surface.set_colorkey(self.symbol_surface, colors.PUZZLE_BG)
+        self.symbol_surface = pygame.Surface((board_rect.width, board_rect.height)).convert()
+        self.symbol_surface.set_colorkey(colors.PUZZLE_BG)
         self.symbol_surface.fill(colors.PUZZLE_BG)
 
         # Create the top clues panel surface.
-        self.top_clues_surface = pygame.Surface((top_clues_rect.width, top_clues_rect.height))
+        self.top_clues_surface = pygame.Surface(top_clues_rect.size).convert()
         self.top_clues_surface.fill(colors.CLUES_BG)
 
         # Create the left clues panel surface.
-        self.left_clues_surface = pygame.Surface((left_clues_rect.width, left_clues_rect.height))
+        self.left_clues_surface = pygame.Surface(left_clues_rect.size).convert()
         self.left_clues_surface.fill(colors.CLUES_BG)
 
+        # Create the surface where the board and the clues panels will be composited,
+        # and the surface where the symbols will be composited on top of them.
+        self.static_surface = pygame.Surface((parent_rect.width, parent_rect.height)).convert()
+        self.frame_surface = pygame.Surface((parent_rect.width, parent_rect.height)).convert()
+        self.__frame_dest = self.frame_surface.get_rect()
+
+        # The top and left outer borders of the board are covered by the clues panels,
+        # so only the rest of the symbol surface is composited.
+        self.__symbol_area = pygame.Rect(self.outer_bdr, self.outer_bdr,
+            board_rect.width - self.outer_bdr, board_rect.height - self.outer_bdr)
+
         # Draw the outer borders.
         self.__draw_rect_borders(self.board_surface, self.outer_bdr)
         self.__draw_rect_borders(self.top_clues_surface, self.outer_bdr)
@@ -214,6 +377,17 @@ class Renderer:
         # Draw the symbols.
         self.update_symbols()
 
+    @staticmethod
+    def __flatten_clues_grid(grid: list[list[int]]) -> list[tuple[int, int, int]]:
+        """
+        Flatten the clues grid into a list of (row index, col index, number),
+        skipping the empty clue cells, so that drawing the clues does not
+        have to walk the whole grid.
+        """
+        return [(row_idx, col_idx, num)
+                for row_idx, grid_row in enumerate(grid)
+                for col_idx, num in enumerate(grid_row) if num > 0]
+
     ################################################################################################
     # COORDINATE & RECT GETTER METHODS
     ################################################################################################
@@ -226,32 +400,33 @@ class Renderer:
         Note that `self.board_rect` is the rect relative to `self.parent_rect`,
         so its actual position needs to be adjusted.
         """
-        board_x = self.parent_rect.x + self.board_rect.x + self.__pan_delta.x
-        board_y = self.parent_rect.y + self.board_rect.y + self.__pan_delta.y
-        board_rect = self.board_surface.get_rect().move(board_x, board_y)
-        return board_rect
+        return self.__actual_board_rect.copy()
+
+    def __update_actual_board_rect(self) -> None:
+        """
+        Recalculate the actual board rect. Must be called whenever the layout or the pan changes.
+        """
+        self.__actual_board_rect.update(
+            self.parent_rect.x + self.board_rect.x + self.__pan_dx,
+            self.parent_rect.y + self.board_rect.y + self.__pan_dy,
+            self.board_rect.width, self.board_rect.height)
+        self.__board_origin_x = self.__actual_board_rect.x + self.outer_bdr
+        self.__board_origin_y = self.__actual_board_rect.y + self.outer_bdr
 
     def get_board_cell_rect(self, row_idx: int, col_idx: int) -> pygame.Rect:
         """
         Get the rect surrounding the specified cell. The rect is relative to the board.
-        """
-        if (row_idx, col_idx) in self.__cell_rect_memo:
-            return self.__cell_rect_memo[(row_idx, col_idx)]
 
-        offset = (self.outer_bdr, self.outer_bdr, 0, 0)
-        cell_rect = utils.get_cell_rect(row_idx, col_idx, self.cell_size,
-            self.cell_size, self.cell_bdr, self.sep_bdr, offset)
-        
-        self.__cell_rect_memo[(row_idx, col_idx)] = cell_rect
-        return cell_rect
+        The rect is shared, so it must not be modified in-place.
+        """
+        return self.__cell_rects[row_idx][col_idx]
 
     def is_coord_in_board(self, coord_x: float, coord_y: float) -> bool:
         """
         Returns true if the specified coordinate is inside the board rect.
         Returns false otherwise.
         """
-        board_rect = self.get_actual_board_rect()
-        board_rect.inflate_ip(self.outer_bdr * -2, self.outer_bdr * -4)
+        board_rect = self.__actual_board_rect.inflate(self.outer_bdr * -2, self.outer_bdr * -4)
         return board_rect.collidepoint(coord_x, coord_y)
 
     def screen_coord_to_cell_idx(self, screen_x: float, screen_y: float) -> CellIdx:
@@ -259,68 +434,38 @@ class Renderer:
         Convert a point in the screen coordinates to its board coordinates,
         i.e. the board row index and column index.
         """
-        # Get the board rect. Remove the outer borders.
-        board_rect = self.get_actual_board_rect()
-        board_rect.inflate_ip(self.outer_bdr * -2, self.outer_bdr * -2)
-        
         return CellIdx(utils.screen_coord_to_cell_idx(screen_x, screen_y,
-            board_rect, self.cell_size, self.cell_bdr, self.sep_bdr))
+            self.__board_origin_x, self.__board_origin_y, self.__board_metrics))
 
-    def get_draft_cell_indices(self) -> list[CellIdx]:
+    def get_draft_cell_indices(self) -> Iterator[tuple[int, int]]:
         """
-        Get the row/col indices of the draft cells.
+        Iterate over the row/col indices of the draft cells.
         """
-        cells: list[CellIdx] = []
         if not self.is_drafting:
-            return cells
+            return
         
         if self.draft_start_cell is None or self.draft_end_cell is None:
             logger.error('Draft start/end cell is None during draft mode.')
-            return cells
-        
-        # If the draft is vertical.
-        if self.draft_start_cell.col == self.draft_end_cell.col:
-            col = self.draft_start_cell.col
-            min_row = min(self.draft_start_cell.row, self.draft_end_cell.row)
-            max_row = max(self.draft_start_cell.row, self.draft_end_cell.row)
-            for row in range(min_row, max_row + 1):
-                cells.append(CellIdx(row, col))
-        
-        # Else if the draft is horizontal.
-        elif self.draft_start_cell.row == self.draft_end_cell.row:
-            row = self.draft_start_cell.row
-            min_col = min(self.draft_start_cell.col, self.draft_end_cell.col)
-            max_col = max(self.draft_start_cell.col, self.draft_end_cell.col)
-            for col in range(min_col, max_col + 1):
-                cells.append(CellIdx(row, col))
-
-        # Else if the draft is neither vertical nor horizontal.
-        else:
-            logger.error(f'The draft start cell ({tuple(self.draft_start_cell)}) and '
-                         f'the draft end cell ({tuple(self.draft_end_cell)}) are not aligned.')
-
-        return cells
-
-    def get_draft_start_ortho_cells(self) -> list[CellIdx]:
-        """
-        Get the row/col indices of the cells that are orthogonal to the draft start cell,
-        including the draft start cell itself.
-        """
-        cells = []
-        if not self.is_drafting:
-            return cells
+            return
         
-        if self.draft_start_cell is None or self.draft_end_cell is None:
-            logger.error('Draft start cell is None during draft mode.')
-            return cells
+        start_row, start_col = self.draft_start_cell.row, self.draft_start_cell.col
+        end_row, end_col = self.draft_end_cell.row, self.draft_end_cell.col
 
-        for row_idx in range(self.puzzle.nrows):
-            cells.append((row_idx, self.draft_start_cell.col))
-
-        for col_idx in range(self.puzzle.ncols):
-            cells.append((self.draft_start_cell.row, col_idx))
+        is_vertical = start_col == end_col
+        if not is_vertical and start_row != end_row:
+            logger.error('The draft start cell (%s) and the draft end cell (%s) are not aligned.',
+                         tuple(self.draft_start_cell), tuple(self.draft_end_cell))
+            return
 
-        return cells
+        # Walk along the varying axis while the other index stays fixed.
+        if is_vertical:
+            lo, hi = (start_row, end_row) if start_row < end_row else (end_row, start_row)
+            for row in range(lo, hi + 1):
+                yield row, start_col
+        else:
+            lo, hi = (start_col, end_col) if start_col < end_col else (end_col, start_col)
+            for col in range(lo, hi + 1):
+                yield start_row, col
 
     ################################################################################################
     # USER INTERACTION METHODS
@@ -330,25 +475,26 @@ class Renderer:
         """
         Start dragging.
         """
-        self.__pan_orig_coord = Coord((curr_x, curr_y))
-        self.__pan_orig_delta = self.pan_delta
+        self.__pan_orig_x = curr_x
+        self.__pan_orig_y = curr_y
+        self.__pan_orig_dx = self.__pan_dx
+        self.__pan_orig_dy = self.__pan_dy
         self.is_dragging = True
 
     def update_drag(self, curr_x: float, curr_y: float) -> None:
         """
         Update the pan delta.
         """
-        orig_x, orig_y = self.__pan_orig_coord
-        delta_x = curr_x - orig_x
-        delta_y = curr_y - orig_y
-        self.__pan_delta = self.__pan_orig_delta.move((delta_x, delta_y))
+        self.__pan_dx = self.__pan_orig_dx + (curr_x - self.__pan_orig_x)
+        self.__pan_dy = self.__pan_orig_dy + (curr_y - self.__pan_orig_y)
+        self.__update_actual_board_rect()
+        self.__is_dirty = True
+        self.__needs_full_update = True
 
     def end_drag(self) -> None:
         """
         End the drag.
         """
-        self.__pan_orig_coord = None
-        self.__pan_orig_delta = None
         self.is_dragging = False
 
     def zoom(self, value: int) -> None:
@@ -370,6 +516,7 @@ class Renderer:
         self.draft_end_cell = CellIdx(row_idx, col_idx)
         self.draft_symbol = symbol
         self.is_drafting = True
+        self.__is_dirty = True
 
     def update_draft(self, row_idx: int, col_idx: int) -> None:
         """
@@ -378,20 +525,31 @@ class Renderer:
         Drafting is editing the puzzle symbols
         but the changes have not yet been finalized.
         """
+        self.__mark_draft_cells_dirty()
+
         vertical_len = abs(self.draft_start_cell.row - row_idx)
         horizontal_len = abs(self.draft_start_cell.col - col_idx)
         if horizontal_len >= vertical_len:
             self.draft_end_cell = CellIdx(self.draft_start_cell.row, col_idx)
         else:
             self.draft_end_cell = CellIdx(row_idx, self.draft_start_cell.col)
+        self.__is_dirty = True
 
     def end_draft(self) -> None:
         """
         Finalize the draft.
         """
-        self.draft_start_pt = None
+        self.__mark_draft_cells_dirty()
         self.draft_symbol = ' '
         self.is_drafting = False
+        self.__is_dirty = True
+
+    def __mark_draft_cells_dirty(self) -> None:
+        """
+        Mark the current draft cells as dirty so that their symbols will be redrawn
+        the next time the symbols are updated.
+        """
+        self.__dirty_cells.update(self.get_draft_cell_indices())
 
     ################################################################################################
     # RENDER METHOD
@@ -400,24 +558,93 @@ class Renderer:
     def render(self) -> None:
         """
         Render the current puzzle.
+
+        Nothing is drawn if nothing has changed since the last render.
         """
-        render_list: list[tuple[pygame.Surface, pygame.Rect]] = []
+        if not self.__is_dirty:
+            return
 
-        board_rect = self.get_actual_board_rect()
-        render_list.append((self.board_surface, board_rect))
-        render_list.append((self.symbol_surface, board_rect))
+        if self.__is_static_surface_stale:
+            self.__composite_static_surface()
+
+        frame_surface = self.frame_surface
+        updated_cell_rects = self.__updated_cell_rects
+        is_full_update = (self.__needs_full_update
+                          or len(updated_cell_rects) > Renderer.MAX_UPDATE_RECTS)
+
+        # Bring the frame surface up to date. If only a few symbols changed, only those cells
+        # are restored from the static surface and then overlaid with their new symbols.
+        # The areas include the cell borders, where the crossed out symbols end.
+        frame_areas: list[pygame.Rect] = []
+        if self.__is_frame_surface_stale or len(updated_cell_rects) > Renderer.MAX_UPDATE_RECTS:
+            self.__composite_frame_surface()
+        elif updated_cell_rects:
+            board_x, board_y = self.board_rect.topleft
+            bdr = self.cell_bdr * 2
+            symbol_areas = [rect.inflate(bdr, bdr).clip(self.__symbol_area)
+                            for rect in updated_cell_rects]
+            frame_areas = [area.move(board_x, board_y) for area in symbol_areas]
+            frame_surface.blits([(self.static_surface, area, area) for area in frame_areas],
+                                doreturn=False)
+            frame_surface.blits([(self.symbol_surface, frame_area, area)
+                                 for frame_area, area in zip(frame_areas, symbol_areas)],
+                                doreturn=False)
+
+        # Move the destination rect according to the current pan delta.
+        frame_dest = self.__frame_dest
+        frame_dest.topleft = (self.parent_rect.x + self.__pan_dx,
+                              self.parent_rect.y + self.__pan_dy)
+
+        if is_full_update:
+            # Nothing but the frame is drawn on the screen, so only the area where the frame
+            # was previously rendered needs to be cleared. Then, only that area and the area
+            # where the frame is now rendered need to be updated (e.g. while panning).
+            prev_frame_dest = self.__prev_frame_dest
+            if prev_frame_dest is None:
+                self.screen.fill(colors.MAIN_BG)
+            else:
+                self.screen.fill(colors.MAIN_BG, prev_frame_dest)
+            # Skip the frame if it has been panned or zoomed completely off the screen.
+            if self.screen.get_rect().colliderect(frame_dest):
+                self.screen.blit(frame_surface, frame_dest)
+            if prev_frame_dest is None:
+                pygame.display.update()
+            else:
+                pygame.display.update(frame_dest.union(prev_frame_dest))
+            self.__prev_frame_dest = frame_dest.copy()
+        else:
+            # Only copy the changed parts of the frame, and update only those parts of the display.
+            screen_rects = [area.move(frame_dest.topleft) for area in frame_areas]
+            self.screen.blits([(frame_surface, screen_rect, area)
+                               for screen_rect, area in zip(screen_rects, frame_areas)],
+                              doreturn=False)
+            pygame.display.update(screen_rects)
 
-        top_clues_y = self.parent_rect.y + self.top_clues_rect.y + self.__pan_delta.y
-        top_clues_rect = self.top_clues_surface.get_rect().move(board_rect.x, top_clues_y)
-        render_list.append((self.top_clues_surface, top_clues_rect))
+        updated_cell_rects.clear()
+        self.__needs_full_update = False
+        self.__is_dirty = False
 
-        left_clues_x = self.parent_rect.x + self.left_clues_rect.x + self.__pan_delta.x
-        left_clues_rect = self.left_clues_surface.get_rect().move(left_clues_x, board_rect.y)
-        render_list.append((self.left_clues_surface, left_clues_rect))
+    def __composite_static_surface(self) -> None:
+        """
+        Composite the board and the clues panels into the static surface,
+        so that they can be rendered with a single blit.
+        """
+        self.static_surface.fill(colors.MAIN_BG)
+        Renderer.__blit_all(self.static_surface, [
+            (self.board_surface, self.board_rect.topleft),
+            (self.top_clues_surface, self.top_clues_rect.topleft),
+            (self.left_clues_surface, self.left_clues_rect.topleft)])
+        self.__is_static_surface_stale = False
+        self.__is_frame_surface_stale = True
 
-        self.screen.fill(colors.MAIN_BG)
-        self.screen.blits(render_list)
-        pygame.display.update()
+    def __composite_frame_surface(self) -> None:
+        """
+        Composite the static surface and the symbols into the frame surface.
+        """
+        symbol_dest = self.__symbol_area.move(self.board_rect.topleft)
+        self.frame_surface.blit(self.static_surface, (0, 0))
+        self.frame_surface.blit(self.symbol_surface, symbol_dest, self.__symbol_area)
+        self.__is_frame_surface_stale = False
 
     def update_symbols(self, mode: str = 'all') -> None:
         """
@@ -425,44 +652,79 @@ class Renderer:
 
         The `mode` parameter can be set to:
         - `all`: All cells will be updated.
-        - `draft`: Only the draft cells will be updated.
+        - `dirty`: Only the cells that changed since the last update will be updated.
         """
         mode = mode.lower()
-        if mode not in ('all', 'draft'):
-            msg = f'Update symbols mode "{mode}" is not supported. Mode will be set to "all".'
-            logger.warning(msg)
-            console.warning(msg)
+        if mode not in ('all', 'dirty'):
+            msg = 'Update symbols mode "%s" is not supported. Mode will be set to "all".'
+            logger.warning(msg, mode)
+            console.warning(msg, mode)
             mode = 'all'
 
+        # The sprites are collected while the cells are updated, then blitted all at once
+        # before the draft symbols are drawn over them.
+        blit_list: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        # Bind the frequently used attributes to locals for the loops below.
+        surface = self.symbol_surface
+        board = self.puzzle.board
+        cell_rects = self.__cell_rects
+        draw_symbol = self.__draw_symbol
+        updated_cell_rects = self.__updated_cell_rects
+
         # If the mode is ALL, update the current symbols of all the cells.
         if mode == 'all':
-            self.symbol_surface.fill(colors.PUZZLE_BG)
-            for row_idx, board_row in enumerate(self.puzzle.board):
-                for col_idx, symbol in enumerate(board_row):
-                    cell_rect = self.get_board_cell_rect(row_idx, col_idx)
-                    self.__draw_symbol(self.symbol_surface, cell_rect, self.cell_size, symbol,
-                        colors.MAIN_SYMBOL, erase_cell=False)
-
-        # If the mode is DRAFT, redraw the current symbols of only the cells
-        # that are orthogonal to the start draft cell.
-        elif mode == 'draft':
-            for row_idx, col_idx in self.get_draft_start_ortho_cells():
-                symbol = self.puzzle.board[row_idx][col_idx]
-                cell_rect = self.get_board_cell_rect(row_idx, col_idx)
-                self.__draw_symbol(self.symbol_surface, cell_rect,
-                    self.cell_size, symbol, colors.MAIN_SYMBOL)
-        
+            surface.fill(colors.PUZZLE_BG)
+            filled_sprite = self.__symbol_sprites[('.', colors.MAIN_SYMBOL)]
+            x_sprite = self.__symbol_sprites[('x', colors.MAIN_SYMBOL)]
+            padding = self.__symbol_padding
+            margin = self.__x_sprite_margin
+            ncols = self.puzzle.ncols
+            cell_xs = self.__cell_xs
+            for board_row, y, cell_rects_row in zip(board, self.__cell_ys, cell_rects):
+                # Skip the rows that are all blank without walking their cells.
+                if board_row.count(' ') == ncols:
+                    continue
+                for symbol, x, cell_rect in zip(board_row, cell_xs, cell_rects_row):
+                    if symbol == '.':
+                        blit_list.append((filled_sprite, (x + padding, y + padding)))
+                    elif symbol == 'x':
+                        blit_list.append((x_sprite, (x - margin, y - margin)))
+                    elif symbol != ' ':
+                        draw_symbol(surface, cell_rect, symbol, colors.MAIN_SYMBOL,
+                            erase_cell=False)
+            self.__is_frame_surface_stale = True
+            self.__needs_full_update = True
+
+        # If the mode is DIRTY, redraw the current symbols of only the dirty cells,
+        # e.g. the cells that were drafted before but are not drafted anymore.
+        elif mode == 'dirty':
+            for row_idx, col_idx in self.__dirty_cells:
+                cell_rect = cell_rects[row_idx][col_idx]
+                draw_symbol(surface, cell_rect, board[row_idx][col_idx], colors.MAIN_SYMBOL,
+                    blit_list=blit_list)
+                updated_cell_rects.append(cell_rect)
+
+        self.__dirty_cells.clear()
+        Renderer.__blit_all(surface, blit_list)
+        blit_list.clear()
+
         # Then, regardless of the mode, render the draft symbols (but only if currently drafting).
         if self.is_drafting:
+            draft_symbol = self.draft_symbol
             for row_idx, col_idx in self.get_draft_cell_indices():
-                if self.draft_symbol == ' ':
-                    new_symbol = self.puzzle.board[row_idx][col_idx]
+                if draft_symbol == ' ':
+                    new_symbol = board[row_idx][col_idx]
                 else:
-                    new_symbol = self.draft_symbol
-                
-                cell_rect = self.get_board_cell_rect(row_idx, col_idx)
-                self.__draw_symbol(self.symbol_surface, cell_rect, self.cell_size,
-                    new_symbol, colors.DRAFT_SYMBOL)
+                    new_symbol = draft_symbol
+
+                cell_rect = cell_rects[row_idx][col_idx]
+                draw_symbol(surface, cell_rect, new_symbol, colors.DRAFT_SYMBOL,
+                    blit_list=blit_list)
+                updated_cell_rects.append(cell_rect)
+
+        Renderer.__blit_all(surface, blit_list)
+        self.__is_dirty = True
 
     def update_clues(self, mode: str = 'all') -> None:
         """
@@ -475,9 +737,9 @@ class Renderer:
         """
         mode = mode.lower()
         if mode not in ('all', 'top', 'left'):
-            msg = f'Update clues mode "{mode}" is not supported. Mode will be set to "all".'
-            logger.warning(msg)
-            console.warning(msg)
+            msg = 'Update clues mode "%s" is not supported. Mode will be set to "all".'
+            logger.warning(msg, mode)
+            console.warning(msg, mode)
             mode = 'all'
 
         sz = self.cell_size
@@ -486,17 +748,17 @@ class Renderer:
 
         if top_clues_flag:
             surface = self.top_clues_surface
-            grid = self.puzzle.top_clues_grid
-            ticks = self.puzzle.top_clues_ticks
-            self.__draw_clues_numbers(surface, grid, ticks, sz, sz, 
-                self.outer_bdr, self.cell_bdr, self.sep_bdr, colors.BLACK)
+            self.__draw_clues_numbers(surface, self.__top_clues, self.__top_clue_centers,
+                sz, colors.BLACK)
         
         if left_clues_flag:
             surface = self.left_clues_surface
-            grid = self.puzzle.left_clues_grid
-            ticks = self.puzzle.left_clues_ticks
-            self.__draw_clues_numbers(surface, grid, ticks, sz, sz, 
-                self.outer_bdr, self.cell_bdr, self.sep_bdr, colors.BLACK)
+            self.__draw_clues_numbers(surface, self.__left_clues, self.__left_clue_centers,
+                sz, colors.BLACK)
+
+        self.__is_static_surface_stale = True
+        self.__is_dirty = True
+        self.__needs_full_update = True
 
     ################################################################################################
     # DRAW HELPER METHODS
@@ -513,45 +775,28 @@ class Renderer:
             rect: The rect that dictates the size and position of the border/s to draw.
                   If not specified, the border will be drawn on the outer edges
                   of the given surface.
-            flags: The flag that dictates which border side/s to draw.
-                   If not specified, borders on all sides will be drawn.
             color: The border color.
         """
         if rect is None:
             rect = pygame.Rect(0, 0, surface.get_width(), surface.get_height())
 
-        for i in range(thickness):
-            # Draw the TOP border.
-            p1 = (0, i)
-            p2 =  (rect.width - 0.5, i)
-            pygame.draw.line(surface, color, p1, p2, 1)
-            
-            # Draw the RIGHT border.
-            p1 = (rect.width - (i + 1), 0)
-            p2 = (rect.width - (i + 1), rect.height - 0.5)
-            pygame.draw.line(surface, color, p1, p2, 1)
-                
-            # Draw the BOTTOM border.
-            p1 = (0, rect.height - (i + 1))
-            p2 = (rect.width - 0.5, rect.height - (i + 1))
-            pygame.draw.line(surface, color, p1, p2, 1)
-
-            # Draw the LEFT border.
-            p1 = (i, 0)
-            p2 = (i, rect.height - 0.5)
-            pygame.draw.line(surface, color, p1, p2, 1)
+        x, y, w, h = rect
+        surface.fill(color, (x, y, w, thickness))                   # Top
+        surface.fill(color, (x, y + h - thickness, w, thickness))   # Bottom
+        surface.fill(color, (x, y, thickness, h))                   # Left
+        surface.fill(color, (x + w - thickness, y, thickness, h))   # Right
 
     def __draw_cell_borders(self,
         surface: pygame.Surface,
         nrows: int,
         ncols: int,
-        cell_size: float,
+        cell_size: int,
         cell_bdr: int,
         sep_bdr: int,
         sep_h: bool,
         sep_v: bool,
         rect: Optional[pygame.Rect] = None,
-        offset_outer_bdr: Optional[float] = 0,
+        offset_outer_bdr: int = 0,
         color: tuple = colors.BORDER) -> None:
         """
         Draw the cell borders.
@@ -571,8 +816,8 @@ class Renderer:
             rect = pygame.Rect(0, 0, surface.get_width(), surface.get_height())
 
         if sep_bdr < cell_bdr:
-            logger.warning(f'The separator border ({sep_bdr}) is smaller '
-                           f'than the cell border ({cell_bdr}).')
+            logger.warning('The separator border (%d) is smaller than the cell border (%d).',
+                           sep_bdr, cell_bdr)
             sep_h, sep_v = False, False
 
         if offset_outer_bdr > 0:
@@ -582,148 +827,194 @@ class Renderer:
                 rect.width - offset_outer_bdr * 2,
                 rect.height - offset_outer_bdr * 2)
 
-        # Draw horizontal cell borders.
-        for i in range(cell_bdr):
-            for row_idx in range(nrows - 1):
-                y = rect.y
-                y += (cell_size + cell_bdr) * row_idx   # Skip the previous rows.
-                y += (row_idx // 5) * (sep_bdr - cell_bdr) # Skip previous sep borders.
-                y += i                          # Skip the previously drawn borders.
-                y += cell_size                  # Draw the line below the current row.
-                p1 = (rect.x, y)
-                p2 = (rect.x + rect.width + 0.5, y)
-                pygame.draw.line(surface, color, p1, p2, 1)
-
-                if sep_h and (row_idx != nrows - 1) and (row_idx + 1) % 5 == 0:
-                    for sep_idx in range(sep_bdr - cell_bdr):
-                        p1 = (rect.x, y + sep_idx + 1)
-                        p2 = (rect.x + rect.width + 0.5, y + sep_idx + 1)
-                        pygame.draw.line(surface, color, p1, p2, 1)
-
-        # Draw vertical cell borders.
-        for i in range(cell_bdr):
-            for col_idx in range(ncols - 1):
-                x = rect.x
-                x += (cell_size + cell_bdr) * col_idx  # Skip the previous columns.
-                x += (col_idx // 5) * (sep_bdr - cell_bdr) # Skip previous sep borders.
-                x += i                          # Skip the previously drawn borders.
-                x += cell_size                  # Draw the line to the right of the current column.
-                p1 = (x, rect.y)
-                p2 = (x, rect.y + rect.height + 0.5)
-                pygame.draw.line(surface, color, p1, p2, 1)
-                
-                if sep_v and (col_idx != ncols - 1) and (col_idx + 1) % 5 == 0:
-                    for sep_idx in range(sep_bdr - cell_bdr):
-                        p1 = (x + sep_idx + 1, rect.y)
-                        p2 = (x + sep_idx + 1, rect.y + rect.height + 0.5)
-                        pygame.draw.line(surface, color, p1, p2, 1)
-
-    def __draw_clues_numbers(self, surface: pygame.Surface, grid: list[list[int]],
-        ticks: list[list[int]], cell_width: float, cell_height: float, outer_bdr: int,
-        cell_bdr: int, sep_bdr: int, color: tuple) -> None:
-        """
-        Draw the clue numbers.
-        """
-        font_render_list: list[tuple[pygame.Surface, pygame.Rect]] = []
-        tick_render_list: list[tuple[pygame.Surface, pygame.Rect]] = []
-        font = self.__get_font(min(cell_width, cell_height))
-
-        cell_rect_offset = (outer_bdr, outer_bdr, 0, 0)
-
-        for row_idx in range(len(grid)):
-            for col_idx in range(len(grid[row_idx])):
-                num = grid[row_idx][col_idx]
-                if num <= 0:
-                    continue
-                cell_rect = utils.get_cell_rect(row_idx, col_idx, cell_width, cell_height,
-                    cell_bdr, sep_bdr, cell_rect_offset)
-                text_surface = font.render(str(num), True, color)
-                text_rect = text_surface.get_rect()
-                x = cell_rect.centerx - text_rect.centerx
-                y = cell_rect.centery - text_rect.centery + (text_rect.height / 12)
-                draw_rect = pygame.Rect(x, y, text_rect.width, text_rect.height)
-                font_render_list.append((text_surface, draw_rect))
+        # Draw horizontal cell borders, one band per border.
+        for y, thickness in utils.calc_border_bands(nrows, cell_size, cell_bdr, sep_bdr, sep_h):
+            surface.fill(color, (rect.x, rect.y + y, rect.width + 1, thickness))
+
+        # Draw vertical cell borders, one band per border.
+        for x, thickness in utils.calc_border_bands(ncols, cell_size, cell_bdr, sep_bdr, sep_v):
+            surface.fill(color, (rect.x + x, rect.y, thickness, rect.height + 1))
 
-        surface.blits(font_render_list)
+    def __draw_clues_numbers(self, surface: pygame.Surface, clues: list[tuple[int, int, int]],
+        centers: list[tuple[int, int]], cell_size: int, color: tuple) -> None:
+        """
+        Draw the clue numbers, each centered on its precomputed cell center.
+        """
+        font_render_list: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        font = self.__get_font(cell_size)
+
+        for (_, _, num), (center_x, center_y) in zip(clues, centers):
+            text_surface, (offset_x, offset_y) = self.__render_num(font, num, color)
+            font_render_list.append((text_surface, (center_x + offset_x, center_y + offset_y)))
+
+        Renderer.__blit_all(surface, font_render_list)
+
+    def __render_num(self, font: pygame.font.Font, num: int,
+        color: tuple) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Render the number with the given font and color.
+        The rendered numbers are cached until the surfaces are reinitialized.
+
+        Returns the rendered number, and the offset from the cell center
+        where it should be drawn so that it looks centered in the cell.
+        """
+        key = (id(font), num, color)
+        rendered = self.__text_cache.get(key)
+        if rendered is None:
+            text_surface = font.render(str(num), True, color)
+            text_width, text_height = text_surface.get_size()
+            # Nudge the number down a bit, since the digits sit above the font's descent.
+            offset = (-(text_width // 2), -(text_height // 2) + (text_height // 12))
+            rendered = (text_surface, offset)
+            self.__text_cache[key] = rendered
+        return rendered
 
     def __draw_symbol(self, surface: pygame.Surface, cell_rect: pygame.Rect,
-        cell_size: int, symbol: str, color: tuple, erase_cell: bool = True) -> None:
+        symbol: str, color: tuple, erase_cell: bool = True,
+        blit_list: Optional[list[tuple[pygame.Surface, tuple[int, int]]]] = None) -> None:
         """
         Render a symbol on the symbols surface.
+
+        If a blit list is given, the pre-rendered symbols are appended to it
+        instead of being blitted right away.
         """
         if not erase_cell and symbol == ' ':
             return
 
-        # Calculate the padding between the symbol and the cell borders.
-        if cell_size <= 6:
-            padding = 0
-        elif cell_size < 18:
-            padding = 1
-        elif cell_size < 28:
-            padding = 2
-        elif cell_size < 50:
-            padding = 3
-        else:
-            padding = int(cell_size * 0.06)
-
         # Get the rect that encloses the cell and the rect that encloses the symbol.
-        symbol_rect = pygame.Rect(cell_rect.x + padding,
-                                  cell_rect.y + padding,
-                                  cell_rect.width + padding * -2,
-                                  cell_rect.height + padding * -2)
+        padding = self.__symbol_padding
+        symbol_rect = cell_rect.inflate(padding * -2, padding * -2)
 
-        # Erase the current symbol if the flag is set.
+        # Erase the current symbol if the flag is set. The borders around the cell are
+        # erased too, since the ends of the crossed out symbol are drawn over them.
         if erase_cell:
-            pygame.draw.rect(surface, colors.PUZZLE_BG, cell_rect)
+            erase_rect = cell_rect.inflate(self.cell_bdr * 2, self.cell_bdr * 2)
+            pygame.draw.rect(surface, colors.PUZZLE_BG, erase_rect)
 
         if symbol == ' ':
             # Do nothing for BLANK cells.
             pass
 
         elif symbol == '.':
-            pygame.draw.rect(surface, color, symbol_rect)
+            sprite = self.__symbol_sprites[(symbol, color)]
+            if blit_list is None:
+                surface.blit(sprite, symbol_rect)
+            else:
+                blit_list.append((sprite, symbol_rect.topleft))
 
         elif symbol == 'x':
-            blend = 1 if color == colors.DRAFT_SYMBOL else 0
-            
-            tl = cell_rect.topleft
-            tr = (tl[0] + cell_size, tl[1] - 1)
-            bl = (tl[0] - 1, tl[1] + cell_size)
-            br = (tr[0], bl[1])
-
-            p1, p2 = tl, br
-            p1b = p1[0] + 1,    p1[1]
-            p1c = p1[0],        p1[1] + 1
-            p2b = p2[0],        p2[1] - 1
-            p2c = p2[0] - 1,    p2[1]
-
-            pygame.draw.aaline(surface, color, p1, p2, blend)
-            if cell_size > 20:
-                pygame.draw.aaline(surface, color, p1b, p2b, 1)
-                pygame.draw.aaline(surface, color, p1c, p2c, 1)
-
-            p1, p2 = bl, tr
-            p1b = p1[0] + 1,    p1[1]
-            p1c = p1[0],        p1[1] - 1
-            p2b = p2[0],        p2[1] + 1
-            p2c = p2[0] - 1,    p2[1]
-
-            pygame.draw.aaline(surface, color, p1, p2, blend)
-            if cell_size > 20:
-                pygame.draw.aaline(surface, color, p1b, p2b, 1)
-                pygame.draw.aaline(surface, color, p1c, p2c, 1)
+            # The crossed out symbol extends past the cell, over the borders around it.
+            margin = self.__x_sprite_margin
+            x_sprite_pos = (cell_rect.x - margin, cell_rect.y - margin)
+            sprite = self.__symbol_sprites[(symbol, color)]
+            if blit_list is None:
+                surface.blit(sprite, x_sprite_pos)
+            else:
+                blit_list.append((sprite, x_sprite_pos))
+
+        else:
+            logger.error('Cannot render unknown symbol: %s', symbol)
+
+    @staticmethod
+    def __blit_all(surface: pygame.Surface,
+        blit_list: list[tuple[pygame.Surface, tuple[int, int]]]) -> None:
+        """
+        Blit all the (source surface, position) pairs onto the surface with a single call.
 
+        Uses `fblits` when available (pygame-ce), which skips the per-blit checks of `blits`.
+        """
+        if Renderer.HAS_FBLITS:
+            surface.fblits(blit_list)
         else:
-            logger.error(f'Cannot render unknown symbol: {symbol}')
+            surface.blits(blit_list, doreturn=False)
+
+    @staticmethod
+    def __build_x_sprite(cell_size: int, margin: int, color: tuple) -> pygame.Surface:
+        """
+        Pre-render the crossed out symbol for the given cell size.
+
+        The sprite is bigger than the cell by the margin on each side, since the ends of
+        the crossed out symbol are drawn over the cell borders. The background is transparent.
+        """
+        sprite_size = cell_size + margin * 2
+        sprite = pygame.Surface((sprite_size, sprite_size)).convert()
+        sprite.fill(colors.PUZZLE_BG)
+        sprite.set_colorkey(colors.PUZZLE_BG)
+
+        blend = 1 if color == colors.DRAFT_SYMBOL else 0
+
+        tl = (margin, margin)
+        tr = (tl[0] + cell_size, tl[1] - 1)
+        bl = (tl[0] - 1, tl[1] + cell_size)
+        br = (tr[0], bl[1])
+
+        p1, p2 = tl, br
+        p1b = p1[0] + 1,    p1[1]
+        p1c = p1[0],        p1[1] + 1
+        p2b = p2[0],        p2[1] - 1
+        p2c = p2[0] - 1,    p2[1]
+
+        pygame.draw.aaline(sprite, color, p1, p2, blend)
+        if cell_size > 20:
+            pygame.draw.aaline(sprite, color, p1b, p2b, 1)
+            pygame.draw.aaline(sprite, color, p1c, p2c, 1)
+
+        p1, p2 = bl, tr
+        p1b = p1[0] + 1,    p1[1]
+        p1c = p1[0],        p1[1] - 1
+        p2b = p2[0],        p2[1] + 1
+        p2c = p2[0] - 1,    p2[1]
+
+        pygame.draw.aaline(sprite, color, p1, p2, blend)
+        if cell_size > 20:
+            pygame.draw.aaline(sprite, color, p1b, p2b, 1)
+            pygame.draw.aaline(sprite, color, p1c, p2c, 1)
+
+        return sprite
+
+    @staticmethod
+    def __get_symbol_padding(cell_size: int) -> int:
+        """
+        Get the padding between the symbol and the cell borders, for the given cell size.
+        """
+        if cell_size <= 6:
+            return 0
+        if cell_size < 18:
+            return 1
+        if cell_size < 28:
+            return 2
+        if cell_size < 50:
+            return 3
+        return int(cell_size * 0.06)
 
-    @lru_cache
     def __get_font(self, cell_size: int) -> pygame.font.Font:
         """
         Get the optimal font for the cell with the given size.
         """
+        font = self.__font_by_cell_size.get(cell_size)
+        if font is None:
+            font = self.__find_font(cell_size)
+            self.__font_by_cell_size[cell_size] = font
+        return font
+
+    def __find_font(self, cell_size: int) -> pygame.font.Font:
+        """
+        Find the largest font whose text fits in the cell with the given size.
+        """
         padding = 2
-        for font in self.__fonts:
+        for font_size in Renderer.FONT_SIZES:
+            font = self.__load_font(font_size)
             w, h = font.size('99')
             if w + padding < cell_size and h + padding < cell_size:
                 return font
-        return self.__fonts[-1]
+        return font
+
+    def __load_font(self, font_size: int) -> pygame.font.Font:
+        """
+        Get the font with the given size, loading it first if it hasn't been loaded yet.
+        """
+        font = self.__fonts.get(font_size)
+        if font is None:
+            font = pygame.font.SysFont('consolas', font_size)
+            self.__fonts[font_size] = font
+        return font
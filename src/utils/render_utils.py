@@ -3,13 +3,20 @@ Some useful utility functions for the renderer.
 """
 
 import pygame
-from typing import Optional, Union
+from functools import lru_cache
 import src.constants as constants
 
+# The screen area that the puzzle can fill, after the screen margins are taken into account.
+_USABLE_WIDTH = (constants.SCREEN_WIDTH
+                 - constants.SCREEN_LEFT_MARGIN - constants.SCREEN_RIGHT_MARGIN)
+_USABLE_HEIGHT = (constants.SCREEN_HEIGHT
+                  - constants.SCREEN_TOP_MARGIN - constants.SCREEN_BOTTOM_MARGIN)
+
+
 def calc_rects(
-    board_cell_size: float,
-    top_clues_cell_height: float,
-    left_clues_cell_width: float,
+    board_cell_size: int,
+    top_clues_cell_height: int,
+    left_clues_cell_width: int,
     cell_bdr: int,
     outer_bdr: int,
     sep_bdr: int,
@@ -43,6 +50,31 @@ def calc_rects(
         - The size and position of the left clues panel.
         - The size and position of the parent rect that contains the above.
     """
+    rect_tuples = _calc_rect_tuples(board_cell_size, top_clues_cell_height,
+        left_clues_cell_width, cell_bdr, outer_bdr, sep_bdr,
+        board_nrows, board_ncols, top_clues_nrows, left_clues_ncols)
+    board_rect, top_clues_rect, left_clues_rect, parent_rect = map(pygame.Rect, rect_tuples)
+    return board_rect, top_clues_rect, left_clues_rect, parent_rect
+
+
+@lru_cache(maxsize=16)
+def _calc_rect_tuples(
+    board_cell_size: int,
+    top_clues_cell_height: int,
+    left_clues_cell_width: int,
+    cell_bdr: int,
+    outer_bdr: int,
+    sep_bdr: int,
+    board_nrows: int,
+    board_ncols: int, 
+    top_clues_nrows: int,
+    left_clues_ncols: int) -> \
+    tuple[tuple[int, int, int, int], ...]:
+    """
+    Calculate the rects of `calc_rects` as (x, y, width, height) tuples.
+
+    The results are cached, since the rects only change when the cell size changes.
+    """
     # Add up all the borders from left-to-right and top-to-bottom, including the outer borders.
     board_border_thick_h = ((board_ncols - 1) * cell_bdr) + (outer_bdr * 2)
     board_border_thick_h += (board_ncols - 1) // 5 * (sep_bdr - cell_bdr)
@@ -51,54 +83,33 @@ def calc_rects(
     top_clues_border_thick_v = ((top_clues_nrows - 1) * cell_bdr) + (outer_bdr * 2)
     left_clues_border_thick_h = ((left_clues_ncols - 1) * cell_bdr) + (outer_bdr * 2)
 
-    # Add up the total borders from left-to-right and top-to-bottom,
-    # including both the board and clues panel borders.
-    total_border_thick_h = board_border_thick_h + left_clues_border_thick_h
-    total_border_thick_v = board_border_thick_v + top_clues_border_thick_v
-
-    # The total cell sizes vertically/horizontally.
-    # Does not include the cell borders nor the outer borders.
-    board_cell_size_h = board_ncols * board_cell_size
-    board_cell_size_v = board_nrows * board_cell_size
-    top_clues_cell_size_v = top_clues_nrows * top_clues_cell_height
-    left_clues_cell_size_h = left_clues_ncols * left_clues_cell_width
-
-    # The total cell sizes (board and clues cells) horizontally and vertically.
-    total_cell_size_h = board_cell_size_h + left_clues_cell_size_h
-    total_cell_size_v = board_cell_size_v + top_clues_cell_size_v
+    # Calculate the sizes of the board and the clues panels, including their borders.
+    # The top clues panel is as wide as the board, and the left clues panel is as tall.
+    board_w = board_border_thick_h + (board_ncols * board_cell_size)
+    board_h = board_border_thick_v + (board_nrows * board_cell_size)
+    top_clues_h = top_clues_border_thick_v + (top_clues_nrows * top_clues_cell_height)
+    left_clues_w = left_clues_border_thick_h + (left_clues_ncols * left_clues_cell_width)
 
     # Calculate the size and position of the PARENT rect,
     # which is the rect that surrounds the whole puzzle, i.e. the board and the clues panels.
-    parent_w = total_cell_size_h + total_border_thick_h - outer_bdr
-    parent_h = total_cell_size_v + total_border_thick_v - outer_bdr
-    parent_x = constants.SCREEN_HALF_WIDTH - (parent_w / 2)
-    parent_y = constants.SCREEN_HALF_HEIGHT - (parent_h / 2)
-    parent_rect = pygame.Rect(parent_x, parent_y, parent_w, parent_h)
-
-    # Calculate the BOARD rect.
-    board_w = board_border_thick_h + board_cell_size_h
-    board_h = board_border_thick_v + board_cell_size_v
-    board_x = parent_w - board_w
-    board_y = parent_h - board_h
-    board_rect = pygame.Rect(board_x, board_y, board_w, board_h)
-
-    # Calculate the TOP CLUES rect.
-    top_clues_w = board_w
-    top_clues_h = top_clues_border_thick_v + top_clues_cell_size_v
-    top_clues_x = board_x
-    top_clues_y = 0
-    top_clues_rect = pygame.Rect(top_clues_x, top_clues_y, top_clues_w, top_clues_h)
-
-    # Calculate the LEFT CLUES rect.
-    left_clues_w = left_clues_border_thick_h + left_clues_cell_size_h
-    left_clues_h = board_h
-    left_clues_x = 0
-    left_clues_y = board_y
-    left_clues_rect = pygame.Rect(left_clues_x, left_clues_y, left_clues_w, left_clues_h)
+    # The board shares its top and left outer borders with the clues panels.
+    parent_w = left_clues_w + board_w - outer_bdr
+    parent_h = top_clues_h + board_h - outer_bdr
+    parent_x = (constants.SCREEN_WIDTH - parent_w) // 2
+    parent_y = (constants.SCREEN_HEIGHT - parent_h) // 2
+    parent_rect = (parent_x, parent_y, parent_w, parent_h)
+
+    # The board is at the lower right of the parent rect, next to the clues panels.
+    board_x = left_clues_w - outer_bdr
+    board_y = top_clues_h - outer_bdr
+    board_rect = (board_x, board_y, board_w, board_h)
+    top_clues_rect = (board_x, 0, board_w, top_clues_h)
+    left_clues_rect = (0, board_y, left_clues_w, board_h)
 
     return board_rect, top_clues_rect, left_clues_rect, parent_rect
 
 
+@lru_cache(maxsize=16)
 def calc_optimum_cell_size(
     board_nrows: int,
     board_ncols: int,
@@ -126,104 +137,152 @@ def calc_optimum_cell_size(
     total_nrows = board_nrows + top_clues_nrows
     total_cols = board_ncols + left_clues_ncols
 
-    # Get the total width of all the borders (horizontally and vertically) of each panel.
-    # This includes the outer borders.
-    board_border_thick_h = ((board_ncols - 1) * cell_bdr) + (outer_bdr * 2)
-    board_border_thick_h += ((board_ncols - 1) // 5) * (sep_bdr - cell_bdr)
-    board_border_thick_v = ((board_nrows - 1) * cell_bdr) + (outer_bdr * 2)
-    board_border_thick_v += ((board_nrows - 1) // 5) * (sep_bdr - cell_bdr)
-    top_clues_border_thick_v = ((top_clues_nrows - 1) * cell_bdr) + outer_bdr
-    left_clues_border_thick_h = ((left_clues_ncols - 1) * cell_bdr) + outer_bdr
-
-    # Get the total width of all the borders (board plus clues panels).
-    total_border_thick_h = board_border_thick_h + left_clues_border_thick_h
-    total_border_thick_v = board_border_thick_v + top_clues_border_thick_v
-
-    # Get the usable screen area after the screen margins are taken into account.
-    h_margins = constants.SCREEN_LEFT_MARGIN + constants.SCREEN_RIGHT_MARGIN
-    v_margins = constants.SCREEN_TOP_MARGIN + constants.SCREEN_BOTTOM_MARGIN
-    usable_width = constants.SCREEN_WIDTH - h_margins
-    usable_height = constants.SCREEN_HEIGHT - v_margins
+    # Get the total width of all the borders (board plus clues panels), including the outer
+    # borders. The board and each clues panel share an outer border, so there are 3 of them.
+    # Only the board has separator borders.
+    total_border_thick_h = ((total_cols - 2) * cell_bdr) + (outer_bdr * 3)
+    total_border_thick_h += ((board_ncols - 1) // 5) * (sep_bdr - cell_bdr)
+    total_border_thick_v = ((total_nrows - 2) * cell_bdr) + (outer_bdr * 3)
+    total_border_thick_v += ((board_nrows - 1) // 5) * (sep_bdr - cell_bdr)
 
     # Calculate the optimal cell width and height such that all the usable area is filled up.
-    cell_width = (usable_width - total_border_thick_h) / total_cols
-    cell_height = (usable_height - total_border_thick_v) / total_nrows
+    cell_width = (_USABLE_WIDTH - total_border_thick_h) // total_cols
+    cell_height = (_USABLE_HEIGHT - total_border_thick_v) // total_nrows
 
-    # Set a minimum value for the optimal width/height. Also, convert it to integer.
-    cell_width = max(2, int(cell_width))
-    cell_height = max(2, int(cell_height))
+    # Set a minimum value for the optimal width/height.
+    cell_width = max(2, cell_width)
+    cell_height = max(2, cell_height)
 
     # Return the smaller of the two.
     return min(cell_width, cell_height)
 
 
-def get_cell_rect(
-    row: int,
-    col: int,
-    cell_width: float,
-    cell_height: float,
-    bdr: int,
-    sep_bdr: int,
-    offset: Optional[Union[pygame.Rect, tuple[float, float, float, float]]] = None
-    ) -> pygame.Rect:
+@lru_cache
+def calc_cell_positions(count: int, cell_size: int, bdr: int, sep_bdr: int,
+    offset: int = 0) -> tuple[int, ...]:
     """
-    Get the rect of the specified cell.
+    Calculate the positions of the cells along one axis,
+    i.e. the x of each column or the y of each row.
 
-    This rect is relative to the rect whose (0, 0) coordinate
-    is at the upper left grid corner.
+    Each position is relative to the upper left grid corner: one cell size plus one border
+    per preceding cell, plus the extra thickness of each preceding separator border.
+
+    The positions are cached, so they are only calculated once per cell size.
 
     Parameters:
-        row: The specified cell's row index.
-        col: The specified cell's column index.
+        count: The number of cells along the axis.
+        cell_size: The cell size.
+        bdr: The border thickness.
+        sep_bdr: The thickness of the separator border for the rows/cols that are divisible by 5.
+        offset: Optional offset amount to add to each position.
+
+    Returns:
+        The position of each cell.
+    """
+    return tuple(offset + (idx * (cell_size + bdr)) + ((idx // 5) * (sep_bdr - bdr))
+                 for idx in range(count))
+
+
+def build_cell_rects(nrows: int, ncols: int, cell_width: int, cell_height: int,
+    bdr: int, sep_bdr: int, offset: int = 0) -> list[list[pygame.Rect]]:
+    """
+    Build the rects of all the cells of a grid at once, from the cell positions
+    of `calc_cell_positions`. Cells in the same column share their x,
+    and cells in the same row share their y.
+
+    Parameters:
+        nrows: The number of rows.
+        ncols: The number of columns.
         cell_width: The cell width.
         cell_height: The cell height.
         bdr: The border thickness.
         sep_bdr: The thickness of the separator border for the rows/cols that are divisible by 5.
-        offset: Optional offset amount to offset the
-                x, y, width, and height of the resulting rect.
+        offset: Optional offset amount to add to the x and y of each rect.
+
+    Returns:
+        The rects of each cell, indexed by row then column.
+    """
+    xs = calc_cell_positions(ncols, cell_width, bdr, sep_bdr, offset)
+    ys = calc_cell_positions(nrows, cell_height, bdr, sep_bdr, offset)
+    return [[pygame.Rect(x, y, cell_width, cell_height) for x in xs] for y in ys]
+
+
+@lru_cache
+def calc_border_bands(count: int, cell_size: int, cell_bdr: int, sep_bdr: int,
+    has_sep: bool) -> tuple[tuple[int, int], ...]:
+    """
+    Calculate the positions and thicknesses of the borders between the cells of one axis.
+
+    Parameters:
+        count: The number of cells along the axis.
+        cell_size: The cell size.
+        cell_bdr: The thickness of the border between the cells.
+        sep_bdr: The thickness of the separator border for the rows/cols that are divisible by 5.
+        has_sep: True if the separator borders are drawn along the axis.
 
     Returns:
-        The rect of the specified cell.
+        The (position, thickness) of each border, relative to the first cell.
     """
-    x = (col * cell_width) + (col * bdr) + ((col // 5) * (sep_bdr - bdr))
-    y = (row * cell_height) + (row * bdr) + ((row // 5) * (sep_bdr - bdr))
-    width = cell_width
-    height = cell_height
+    bands = []
+    pos = cell_size
+    for idx in range(1, count):
+        thickness = sep_bdr if has_sep and idx % 5 == 0 else cell_bdr
+        bands.append((pos, thickness))
+        pos += cell_size + (sep_bdr if idx % 5 == 0 else cell_bdr)
+    return tuple(bands)
 
-    if offset is not None:
-        offset_x, offset_y, offset_w, offset_h = offset
-    else:
-        offset_x, offset_y, offset_w, offset_h = 0, 0, 0, 0
 
-    return pygame.Rect(x + offset_x, y + offset_y,
-        width + offset_w, height + offset_h)
+class BoardMetrics:
+    """
+    The cell measurements used to convert screen coordinates to cell indices.
+    Only needs to be recreated when the cell size or the borders change.
+    """
+
+    __slots__ = ('cell_pitch', 'sep_grp_width', 'grid_width', 'grid_height')
 
+    def __init__(self, cell_size: int, cell_bdr: int, sep_bdr: int,
+                 grid_width: int = 0, grid_height: int = 0) -> None:
+        self.cell_pitch = cell_size + cell_bdr
+        """The distance between the starts of two adjacent cells in the same separator-group."""
+        self.sep_grp_width = (self.cell_pitch * 5) + (sep_bdr - cell_bdr)
+        """The width of one separator-group of 5 cells, including the sep_bdr itself."""
+        self.grid_width = grid_width
+        """The width of the grid, not including the outer borders."""
+        self.grid_height = grid_height
+        """The height of the grid, not including the outer borders."""
 
-def screen_coord_to_cell_idx(screen_x: float, screen_y: float, board_rect: pygame.Rect,
-    cell_size: int, cell_bdr: int, sep_bdr: int) -> tuple[int, int]:
+
+def screen_coord_to_cell_idx(screen_x: float, screen_y: float, origin_x: int, origin_y: int,
+    metrics: BoardMetrics) -> tuple[int, int]:
     """
     Convert a point in the screen coordinates to its board coordinates,
     i.e. the board row index and column index.
+
+    The origin is the screen coordinates of the upper left grid corner,
+    not including the outer borders. Returns (-1, -1) for points outside the grid.
     """
-    # Calculate the specified coordinates relative to the board rect.
-    board_x = screen_x - board_rect.x
-    board_y = screen_y - board_rect.y
+    # Calculate the specified coordinates relative to the grid origin.
+    board_x = screen_x - origin_x
+    board_y = screen_y - origin_y
+
+    # Points outside the grid are not in any cell.
+    if (board_x < 0 or board_x >= metrics.grid_width or
+        board_y < 0 or board_y >= metrics.grid_height):
+        return -1, -1
 
-    # Calculate the width of one separator-group, including the sep_bdr itself.
-    sep_grp_width = ((cell_size + cell_bdr) * 5) + (sep_bdr - cell_bdr)
     # Calculate which separator-group the coordinates are in.
+    sep_grp_width = metrics.sep_grp_width
     sep_grp_idx_x = board_x // sep_grp_width
     sep_grp_idx_y = board_y // sep_grp_width
 
     # Calculate which cell in the separator-group the coordinates are in.
-    mod_x = (abs(board_x) - (sep_grp_idx_x * sep_grp_width)) * (-1 if board_x < 0 else 1)
-    mod_y = abs(board_y) - (sep_grp_idx_y * sep_grp_width) * (-1 if board_y < 0 else 1)
-    cell_idx_x = mod_x // (cell_size + cell_bdr)
-    cell_idx_y = mod_y // (cell_size + cell_bdr)
-    cell_idx_x = min(4, cell_idx_x)
-    cell_idx_y = min(4, cell_idx_y)
+    cell_pitch = metrics.cell_pitch
+    mod_x = board_x - (sep_grp_idx_x * sep_grp_width)
+    mod_y = board_y - (sep_grp_idx_y * sep_grp_width)
+    cell_idx_x = min(4, mod_x // cell_pitch)
+    cell_idx_y = min(4, mod_y // cell_pitch)
 
     row_idx = (sep_grp_idx_y * 5) + cell_idx_y
     col_idx = (sep_grp_idx_x * 5) + cell_idx_x
 
-    return int(row_idx), int(col_idx)
\ No newline at end of file
+    return int(row_idx), int(col_idx)